@@ -384,6 +384,7 @@ func updateGitignore(workDir string) {
 		"claude-progress.txt",
 		".claude/fic-*.json",
 		".claude/.claude-harness-initialized",
+		".claude/claude-harness.json.cache*",
 	}
 
 	// Read existing .gitignore
@@ -9,15 +9,50 @@ Supports three strictness levels:
 Performance optimizations:
 - Config caching to avoid repeated disk reads
 - Cache invalidation based on file modification time
+- On-disk cache of the merged config for cold-start hook processes
+- Defaults pre-serialized once so cache misses deep-copy them cheaply
+- orjson used for parsing when available (stdlib json fallback, also
+  for files orjson rejects, e.g. NaN/Infinity written by json.dump)
+- Working directory and config path lookups memoized per process
 """
 
 import os
 import json
+import functools
+import marshal
+import struct
+import zlib
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+# orjson parses several times faster than the stdlib when it is installed
+try:
+    from orjson import loads as _orjson_loads
+
+    def _json_loads(data):
+        """Parse JSON with orjson, retrying with the stdlib if it is rejected.
+
+        save_config writes with json.dump, which emits NaN/Infinity for
+        non-finite floats; orjson refuses those tokens but json accepts them.
+        """
+        try:
+            return _orjson_loads(data)
+        except ValueError:
+            return json.loads(data)
+except ImportError:
+    from json import loads as _json_loads
+
+_CLAUDE_SUBDIR = ".claude"
 CONFIG_FILE = "claude-harness.json"
+INITIALIZED_MARKER_FILE = ".claude-harness-initialized"
+CONFIG_CACHE_FILE = CONFIG_FILE + ".cache"
+
+# On-disk cache header: source file st_mtime_ns and st_size, plus a checksum
+# of the defaults so a plugin upgrade never serves stale merged values.
+# The payload is marshal (plain data only) rather than pickle, since the
+# cache lives in the project directory and must never execute code on load.
+_CACHE_HEADER = struct.Struct('<qqI')
 
 # Config cache for performance - avoids repeated disk reads
 _config_cache: Dict[str, Dict[str, Any]] = {}
@@ -71,24 +106,100 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Pre-serialized defaults - parsing this blob yields a fresh deep copy
+# of DEFAULT_CONFIG in a single C-level pass on every cache miss
+_DEFAULT_TEMPLATE = json.dumps(DEFAULT_CONFIG)
+_DEFAULT_CHECKSUM = zlib.crc32(_DEFAULT_TEMPLATE.encode())
+
+# Sections merged key-by-key with user overrides; everything else is replaced
+_NESTED_KEYS = frozenset(key for key, value in DEFAULT_CONFIG.items() if isinstance(value, dict))
+
+@functools.lru_cache(maxsize=1)
+def _cached_cwd() -> str:
+    """Get the process working directory, looked up once (hooks never chdir)."""
+    return os.getcwd()
+
+
+def invalidate_cwd_cache():
+    """Forget the memoized process working directory (e.g. after os.chdir)."""
+    _cached_cwd.cache_clear()
+
 
 def get_working_directory() -> str:
     """Get the current working directory."""
-    return os.environ.get('CLAUDE_WORKING_DIRECTORY', os.getcwd())
+    work_dir = os.environ.get('CLAUDE_WORKING_DIRECTORY')
+    return work_dir if work_dir is not None else _cached_cwd()
+
+
+@functools.lru_cache(maxsize=8)
+def _config_path_for(work_dir: str) -> Path:
+    """Build the config file path for a working directory, memoized."""
+    return Path(os.path.join(work_dir, _CLAUDE_SUBDIR, CONFIG_FILE))
 
 
 def get_config_path(work_dir: str = None) -> Path:
     """Get path to harness config file."""
     if work_dir is None:
         work_dir = get_working_directory()
-    return Path(work_dir) / '.claude' / CONFIG_FILE
+    return _config_path_for(work_dir)
+
+
+def _get_config_cache_path(config_path: Path) -> Path:
+    """Get path to the on-disk cache of the merged config."""
+    return config_path.with_name(CONFIG_CACHE_FILE)
+
+
+def _read_config_disk_cache(config_path: Path, source_stat: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Read the merged config cached on disk.
+
+    Returns None if the cache is missing, corrupt, or was built from a
+    different version of the source file (mtime or size changed).
+    """
+    try:
+        with open(_get_config_cache_path(config_path), 'rb') as f:
+            data = f.read()
+    except (OSError, IOError):
+        return None
+
+    if len(data) <= _CACHE_HEADER.size:
+        return None
+    if _CACHE_HEADER.unpack_from(data) != (source_stat.st_mtime_ns, source_stat.st_size, _DEFAULT_CHECKSUM):
+        return None
+
+    try:
+        config = marshal.loads(memoryview(data)[_CACHE_HEADER.size:])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return config if isinstance(config, dict) else None
+
+
+def _write_config_disk_cache(config_path: Path, source_stat: os.stat_result, config: Dict[str, Any]):
+    """Write the merged config to the on-disk cache (best effort).
+
+    Written to a temp file and renamed into place so concurrent hooks
+    never read a partially written cache.
+    """
+    cache_path = _get_config_cache_path(config_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_CACHE_HEADER.pack(source_stat.st_mtime_ns, source_stat.st_size, _DEFAULT_CHECKSUM))
+            marshal.dump(config, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, IOError, ValueError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
 
 def load_config(work_dir: str = None, force_reload: bool = False) -> Dict[str, Any]:
     """Load configuration, merging with defaults.
 
     Uses caching with file modification time invalidation to avoid
-    repeated disk reads within the same session.
+    repeated disk reads within the same session. Across sessions (each
+    hook is a fresh process) the merged config is reused from an on-disk
+    cache keyed by the source file's mtime and size.
 
     Args:
         work_dir: Working directory to load config from
@@ -117,27 +228,43 @@ def load_config(work_dir: str = None, force_reload: bool = False) -> Dict[str, A
             # On error, use cache
             return _config_cache[cache_key]
 
-    # Build fresh config
-    config = DEFAULT_CONFIG.copy()
-    # Deep copy nested dicts
-    config['test_commands'] = DEFAULT_CONFIG['test_commands'].copy()
-    config['browser_config'] = DEFAULT_CONFIG['browser_config'].copy()
-    config['fic_config'] = DEFAULT_CONFIG['fic_config'].copy()
-
-    if config_path.exists():
+    # Stat once; the result validates the disk cache and keys the memory cache
+    try:
+        source_stat = config_path.stat()
+    except (OSError, IOError):
+        source_stat = None
+
+    # Cold-start fast path: hooks run in fresh processes, so reuse the merged
+    # config a previous hook left on disk if the source file is unchanged
+    if source_stat is not None and not force_reload:
+        config = _read_config_disk_cache(config_path, source_stat)
+        if config is not None:
+            _config_mtime[cache_key] = source_stat.st_mtime
+            _config_cache[cache_key] = config
+            return config
+
+    # Build fresh config (deep copy of defaults via the pre-serialized template)
+    config = _json_loads(_DEFAULT_TEMPLATE)
+
+    if source_stat is not None:
         try:
-            with open(config_path, 'r') as f:
-                user_config = json.load(f)
-                # Merge user config into defaults
-                for key, value in user_config.items():
-                    if isinstance(value, dict) and key in config and isinstance(config[key], dict):
-                        config[key].update(value)
-                    else:
-                        config[key] = value
+            with open(config_path, 'rb') as f:
+                user_config = _json_loads(f.read())
+
+            # Merge user config into defaults: one update for top-level keys,
+            # then a second-level merge for the known nested sections only
+            nested = {
+                key: {**config[key], **user_config[key]}
+                for key in _NESTED_KEYS.intersection(user_config)
+                if isinstance(user_config[key], dict)
+            }
+            config.update(user_config)
+            config.update(nested)
 
             # Update cache with modification time
-            _config_mtime[cache_key] = config_path.stat().st_mtime
-        except (json.JSONDecodeError, IOError, OSError):
+            _config_mtime[cache_key] = source_stat.st_mtime
+            _write_config_disk_cache(config_path, source_stat, config)
+        except (ValueError, IOError, OSError):
             pass
 
     # Store in cache
@@ -168,8 +295,12 @@ def save_config(config: Dict[str, Any], work_dir: str = None) -> bool:
         with open(config_path, 'w') as f:
             json.dump(config, f, indent=2)
 
-        # Invalidate cache so next load gets fresh config
+        # Invalidate caches so next load gets fresh config
         clear_config_cache(work_dir)
+        try:
+            os.unlink(_get_config_cache_path(config_path))
+        except OSError:
+            pass
 
         return True
     except (IOError, OSError):
@@ -197,9 +328,17 @@ def is_standard_mode(work_dir: str = None) -> bool:
 
 
 def get_setting(key: str, work_dir: str = None) -> Any:
-    """Get a specific config setting."""
+    """Get a specific config setting.
+
+    Nested settings can be read with a dotted key,
+    e.g. "fic_config.auto_compact_threshold".
+    """
     config = load_config(work_dir)
-    return config.get(key)
+    if key in config or '.' not in key:
+        return config.get(key)
+    section, _, name = key.partition('.')
+    value = config.get(section)
+    return value.get(name) if isinstance(value, dict) else None
 
 
 def set_setting(key: str, value: Any, work_dir: str = None) -> bool:
@@ -213,5 +352,4 @@ def is_harness_initialized(work_dir: str = None) -> bool:
     """Check if harness has been initialized for this project."""
     if work_dir is None:
         work_dir = get_working_directory()
-    marker_path = Path(work_dir) / '.claude' / '.claude-harness-initialized'
-    return marker_path.exists()
+    return os.path.exists(os.path.join(work_dir, _CLAUDE_SUBDIR, INITIALIZED_MARKER_FILE))
@@ -214,7 +214,7 @@ def classify_information(
 
     elif tool_name == 'Grep':
         pattern = tool_input.get('pattern', '')
-        matches = result_str.count('\n') + 1 if result_str.strip() else 0
+        matches = result_str.count('\n') + 1 if result_str and not result_str.isspace() else 0
 
         if matches == 0:
             classification = InformationClass.NOISE
@@ -9,9 +9,11 @@ Security:
 """
 
 import os
-from datetime import datetime
+import time
+import atexit
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 try:
     from core.validation import validate_work_dir, safe_join
@@ -26,6 +28,35 @@ except ImportError:
 
 PROGRESS_FILE = "claude-progress.txt"
 
+# Read size for read_progress once the file's initial size has been read
+READ_CHUNK_BYTES = 65536
+
+# Validated progress file paths, keyed by working directory.
+# Validation costs several stat/resolve syscalls and every log_* call
+# needs the path, so it is done once per work_dir per process.
+_progress_path_cache: Dict[str, Path] = {}
+
+# Raw O_APPEND fds kept open across append_progress calls, keyed by path.
+# Each entry is written immediately with a single os.write(), so nothing is
+# lost if the hook process is killed before exit.
+_fd_cache: Dict[str, int] = {}
+_fd_lock = threading.Lock()
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# (epoch second, formatted timestamp) - entries logged within the same
+# second reuse the formatted string instead of calling strftime again
+_ts_cache = (0, "")
+
+
+def _get_timestamp() -> str:
+    """Get the current timestamp string, formatted at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, time.strftime(TIMESTAMP_FORMAT, time.localtime(now)))
+    return _ts_cache[1]
+
 
 def get_progress_path(work_dir: Optional[str] = None) -> Optional[Path]:
     """Get path to progress file.
@@ -39,13 +70,25 @@ def get_progress_path(work_dir: Optional[str] = None) -> Optional[Path]:
     if work_dir is None:
         work_dir = os.getcwd()
 
+    cached = _progress_path_cache.get(work_dir)
+    if cached is not None:
+        return cached
+
     # Validate working directory
     is_valid, error = validate_work_dir(work_dir)
     if not is_valid:
         return None
 
     # Use safe path joining
-    return safe_join(work_dir, PROGRESS_FILE)
+    path = safe_join(work_dir, PROGRESS_FILE)
+    if path is not None:
+        _progress_path_cache[work_dir] = path
+    return path
+
+
+def clear_progress_path_cache():
+    """Clear the cached progress file paths."""
+    _progress_path_cache.clear()
 
 
 def read_progress(work_dir=None) -> str:
@@ -53,9 +96,19 @@ def read_progress(work_dir=None) -> str:
     path = get_progress_path(work_dir)
     if path is None:
         return ""
-    if path.exists():
-        return path.read_text()
-    return ""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return ""
+    try:
+        # Read straight from the fd, bypassing the buffered text IO stack;
+        # the extra read() confirms EOF in case the file grew meanwhile
+        chunks = [os.read(fd, os.fstat(fd).st_size or READ_CHUNK_BYTES)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, READ_CHUNK_BYTES))
+    finally:
+        os.close(fd)
+    return b"".join(chunks).decode('utf-8', errors='replace')
 
 
 def append_progress(message: str, work_dir=None, include_timestamp: bool = True) -> Optional[str]:
@@ -69,17 +122,38 @@ def append_progress(message: str, work_dir=None, include_timestamp: bool = True)
         return None
 
     if include_timestamp:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _get_timestamp()
         entry = f"[{timestamp}] {message}\n"
     else:
         entry = f"{message}\n"
 
-    with open(path, 'a') as f:
-        f.write(entry)
+    path_str = str(path)
+    data = entry.encode('utf-8')
+    with _fd_lock:
+        fd = _fd_cache.get(path_str)
+        if fd is None:
+            fd = os.open(path_str, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _fd_cache[path_str] = fd
+        while data:
+            data = data[os.write(fd, data):]
 
     return entry
 
 
+def close_progress_files():
+    """Close the append fds kept open by append_progress."""
+    with _fd_lock:
+        for fd in _fd_cache.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        _fd_cache.clear()
+
+
+atexit.register(close_progress_files)
+
+
 def log_session_start(work_dir=None):
     """Log session start."""
     append_progress("=== SESSION STARTED ===", work_dir)
@@ -128,7 +202,7 @@ def initialize_progress_file(project_name=None, work_dir=None) -> bool:
     if path.exists():
         return False  # Already exists
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = _get_timestamp()
     project = project_name or Path(work_dir or os.getcwd()).name
 
     content = f"""# Claude Agent Progress Log
@@ -152,5 +226,14 @@ def initialize_progress_file(project_name=None, work_dir=None) -> bool:
 [{timestamp}] INITIALIZED: Progress tracking enabled for {project}
 
 """
-    path.write_text(content)
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        return False  # Created concurrently
+    try:
+        data = content.encode('utf-8')
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
     return True
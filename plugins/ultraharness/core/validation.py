@@ -15,6 +15,9 @@ Security considerations:
 
 import os
 import re
+import stat
+import time
+import functools
 from pathlib import Path
 from typing import Tuple, Optional
 
@@ -22,17 +25,55 @@ from typing import Tuple, Optional
 # Characters that are dangerous in file paths
 DANGEROUS_PATH_CHARS = frozenset(['\x00', '\n', '\r'])
 
-# Patterns that indicate path traversal attempts
-PATH_TRAVERSAL_PATTERNS = [
-    re.compile(r'\.\.[\\/]'),      # ../ or ..\
-    re.compile(r'[\\/]\.\.'),       # /.. or \..
-    re.compile(r'^\.\.'),           # Starts with ..
-]
+# Single-pass matcher for DANGEROUS_PATH_CHARS
+_DANGEROUS_RE = re.compile(r'[\x00\n\r]')
+
+# One-pass filename sanitization: drop dangerous characters, replace path
+# separators and other problematic characters with underscores
+_SANITIZE_TABLE = str.maketrans({
+    '\x00': None, '\n': None, '\r': None,
+    '/': '_', '\\': '_',
+    '<': '_', '>': '_', ':': '_', '"': '_', '|': '_', '?': '_', '*': '_',
+})
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
+# Patterns that indicate path traversal attempts, combined into one regex:
+#   ../ or ..\   |   /.. or \..   |   starts with ..
+_TRAVERSAL_RE = re.compile(r'\.\.[\\/]|[\\/]\.\.|^\.\.')
+
+# Filesystem lookups are cached per ~1s bucket: long enough to cover the
+# repeated validation within one hook invocation, short enough that
+# directory changes are picked up promptly
+_FS_CACHE_SIZE = 32
+
+
+def _cache_bucket() -> int:
+    """Current cache bucket for filesystem lookups (1-second resolution)."""
+    return int(time.monotonic())
+
+
+@functools.lru_cache(maxsize=_FS_CACHE_SIZE)
+def _resolve_cached(path_str: str, bucket: int) -> Path:
+    """Resolve a path, memoized per cache bucket."""
+    return Path(path_str).resolve()
+
+
+def _is_within(base: str, target: str) -> bool:
+    """Check that a resolved path is base itself or inside it.
+
+    Both paths must already be resolved and case-normalized. A string
+    prefix check on the separator boundary is enough for resolved paths,
+    without splitting both into components like os.path.commonpath.
+    """
+    if target == base:
+        return True
+    prefix = base if base.endswith(os.sep) else base + os.sep
+    return target.startswith(prefix)
 
 
 def validate_path(
     path: str,
-    work_dir: str = None,
+    work_dir: Optional[str] = None,
     must_exist: bool = False,
     allow_absolute: bool = True
 ) -> Tuple[bool, Optional[str], Optional[Path]]:
@@ -55,15 +96,14 @@ def validate_path(
         return False, "Path is empty", None
 
     # Check for dangerous characters (null bytes, newlines)
-    for char in DANGEROUS_PATH_CHARS:
-        if char in path:
-            char_name = repr(char)
-            return False, f"Path contains dangerous character: {char_name}", None
+    match = _DANGEROUS_RE.search(path)
+    if match:
+        char_name = repr(match.group())
+        return False, f"Path contains dangerous character: {char_name}", None
 
     # Check for path traversal patterns
-    for pattern in PATH_TRAVERSAL_PATTERNS:
-        if pattern.search(path):
-            return False, "Path contains traversal pattern (../)", None
+    if _TRAVERSAL_RE.search(path):
+        return False, "Path contains traversal pattern (../)", None
 
     # Check absolute path restriction
     if not allow_absolute and os.path.isabs(path):
@@ -75,7 +115,7 @@ def validate_path(
 
         # If work_dir is specified, ensure path is within bounds
         if work_dir:
-            work_path = Path(work_dir).resolve()
+            work_path = _resolve_cached(str(work_dir), _cache_bucket())
 
             # Resolve the full path (handles relative paths)
             if path_obj.is_absolute():
@@ -84,14 +124,13 @@ def validate_path(
                 resolved = (work_path / path_obj).resolve()
 
             # Security check: ensure resolved path is within work_dir
-            # Use os.path.commonpath for reliable cross-platform check
-            try:
-                common = os.path.commonpath([str(work_path), str(resolved)])
-                if common != str(work_path):
-                    return False, f"Path escapes working directory", None
-            except ValueError:
+            work_str = os.path.normcase(str(work_path))
+            resolved_str = os.path.normcase(str(resolved))
+            if os.path.splitdrive(work_str)[0] != os.path.splitdrive(resolved_str)[0]:
                 # Different drives on Windows
                 return False, "Path is on different drive than working directory", None
+            if not _is_within(work_str, resolved_str):
+                return False, f"Path escapes working directory", None
         else:
             resolved = path_obj.resolve() if path_obj.is_absolute() else path_obj
 
@@ -119,10 +158,15 @@ def validate_work_dir(work_dir: str) -> Tuple[bool, Optional[str]]:
         return False, "Working directory is empty"
 
     # Check for dangerous characters
-    for char in DANGEROUS_PATH_CHARS:
-        if char in work_dir:
-            return False, f"Working directory contains dangerous character"
+    if _DANGEROUS_RE.search(work_dir):
+        return False, f"Working directory contains dangerous character"
 
+    return _validate_work_dir_cached(work_dir, _cache_bucket())
+
+
+@functools.lru_cache(maxsize=_FS_CACHE_SIZE)
+def _validate_work_dir_cached(work_dir: str, bucket: int) -> Tuple[bool, Optional[str]]:
+    """Filesystem checks for validate_work_dir, memoized per cache bucket."""
     try:
         path = Path(work_dir)
 
@@ -130,12 +174,12 @@ def validate_work_dir(work_dir: str) -> Tuple[bool, Optional[str]]:
         if not path.is_absolute():
             return False, "Working directory must be absolute path"
 
-        # Must exist
-        if not path.exists():
+        # Must exist and be a directory (one stat call for both checks)
+        try:
+            st = os.stat(work_dir)
+        except (FileNotFoundError, NotADirectoryError):
             return False, "Working directory does not exist"
-
-        # Must be a directory
-        if not path.is_dir():
+        if not stat.S_ISDIR(st.st_mode):
             return False, "Working directory is not a directory"
 
         return True, None
@@ -144,6 +188,18 @@ def validate_work_dir(work_dir: str) -> Tuple[bool, Optional[str]]:
         return False, f"Invalid working directory: {str(e)}"
 
 
+def _is_plain_component(component: str) -> bool:
+    """Check if a path component is a single plain name.
+
+    Plain names have no separators or drive, and are not '.' or '..'.
+    """
+    if not component or component in ('.', '..'):
+        return False
+    if os.sep in component or (os.altsep and os.altsep in component):
+        return False
+    return not os.path.splitdrive(component)[0]
+
+
 def safe_join(base: str, *paths: str) -> Optional[Path]:
     """
     Safely join paths, ensuring result stays within base directory.
@@ -156,25 +212,32 @@ def safe_join(base: str, *paths: str) -> Optional[Path]:
         Resolved Path if safe, None if path escapes base directory
     """
     try:
-        base_path = Path(base).resolve()
+        base_path = _resolve_cached(str(base), _cache_bucket())
 
-        # Join all paths
-        result = base_path
+        # Validate each component
         for p in paths:
-            # Validate each component
             if '\x00' in p:
                 return None
-            result = result / p
+
+        # Fast path: plain names that are not symlinks cannot leave base,
+        # so the joined path is already resolved
+        if all(_is_plain_component(p) for p in paths):
+            joined = str(base_path)
+            for p in paths:
+                joined = os.path.join(joined, p)
+                if os.path.islink(joined):
+                    break
+            else:
+                return Path(joined)
+
+        # Join all paths
+        result = base_path.joinpath(*paths)
 
         # Resolve and check bounds
         resolved = result.resolve()
 
         # Ensure result is within base
-        try:
-            common = os.path.commonpath([str(base_path), str(resolved)])
-            if common != str(base_path):
-                return None
-        except ValueError:
+        if not _is_within(os.path.normcase(str(base_path)), os.path.normcase(str(resolved))):
             return None
 
         return resolved
@@ -197,19 +260,12 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     if not filename:
         return "unnamed"
 
-    # Remove dangerous characters
-    sanitized = filename
-    for char in DANGEROUS_PATH_CHARS:
-        sanitized = sanitized.replace(char, '')
-
-    # Remove path separators
-    sanitized = sanitized.replace('/', '_').replace('\\', '_')
-
-    # Remove other potentially problematic characters
-    sanitized = re.sub(r'[<>:"|?*]', '_', sanitized)
+    # Remove dangerous characters, replace path separators and other
+    # potentially problematic characters (single pass)
+    sanitized = filename.translate(_SANITIZE_TABLE)
 
     # Collapse multiple underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    sanitized = _UNDERSCORE_RUN_RE.sub('_', sanitized)
 
     # Strip leading/trailing whitespace and dots
     sanitized = sanitized.strip('. \t')
@@ -258,9 +314,8 @@ def validate_session_id(session_id: str) -> Tuple[bool, Optional[str]]:
         return False, "Session ID too long"
 
     # Check for dangerous characters
-    for char in DANGEROUS_PATH_CHARS:
-        if char in session_id:
-            return False, "Session ID contains dangerous character"
+    if _DANGEROUS_RE.search(session_id):
+        return False, "Session ID contains dangerous character"
 
     # Check for path traversal
     if '..' in session_id or '/' in session_id or '\\' in session_id:
@@ -12,87 +12,99 @@ Gate behavior by strictness mode:
 
 import os
 import sys
-import json
-from pathlib import Path
-
-# Use shared imports module for consistent fallbacks
-try:
-    from shared_imports import (
-        load_config, is_relaxed_mode, is_harness_initialized,
-        Gate, GateAction, check_gate, format_gate_message,
-        FIC_GATES_AVAILABLE
-    )
-except ImportError:
-    # Fallback: Add plugin root and try direct imports
-    PLUGIN_ROOT = os.environ.get('CLAUDE_PLUGIN_ROOT', '')
-    if PLUGIN_ROOT:
-        sys.path.insert(0, PLUGIN_ROOT)
 
-    try:
-        from core.config import load_config, is_relaxed_mode, is_harness_initialized
-    except ImportError:
-        def load_config(work_dir=None):
-            return {"fic_enabled": True}
-        def is_relaxed_mode(work_dir=None):
-            return False
-        def is_harness_initialized(work_dir=None):
-            return False
+# Marker checked before any harness module is imported, so uninitialized
+# projects (the common case) exit without paying for the imports below
+INITIALIZED_MARKER = os.path.join('.claude', '.claude-harness-initialized')
+
+# File-modifying tools that go through the FIC gates
+GATED_TOOLS = frozenset(('Edit', 'Write'))
 
+
+def import_harness_modules():
+    """Import config and gate modules on demand.
+
+    Deferred until the project is known to be initialized.
+
+    Returns:
+        Namespace with json_loads, json_dumps, load_config, Gate, GateAction,
+        check_gate, format_gate_message and FIC_GATES_AVAILABLE
+    """
+    from types import SimpleNamespace
+
+    # Use shared imports module for consistent fallbacks
     try:
-        from core.verification_gates import Gate, GateAction, check_gate, format_gate_message
-        FIC_GATES_AVAILABLE = True
+        from shared_imports import (
+            json_loads, json_dumps,
+            load_config,
+            Gate, GateAction, check_gate, format_gate_message,
+            FIC_GATES_AVAILABLE
+        )
     except ImportError:
-        FIC_GATES_AVAILABLE = False
-        class Gate:
-            ALLOW_EDIT = "allow_edit"
-            ALLOW_WRITE = "allow_write"
-        class GateAction:
-            ALLOW = "allow"
-            WARN = "warn"
-            BLOCK = "block"
-        def check_gate(gate, work_dir=None, **kwargs):
-            class Result:
-                action = GateAction.ALLOW
-                reason = ""
-                suggestions = []
-            return Result()
-        def format_gate_message(result):
-            return ""
-
-
-def check_fic_gates(tool_name: str, tool_input: dict, work_dir: str, config: dict) -> tuple:
+        import json
+        json_loads, json_dumps = json.loads, json.dumps
+
+        # Fallback: Add plugin root and try direct imports
+        PLUGIN_ROOT = os.environ.get('CLAUDE_PLUGIN_ROOT', '')
+        if PLUGIN_ROOT:
+            sys.path.insert(0, PLUGIN_ROOT)
+
+        try:
+            from core.config import load_config
+        except ImportError:
+            from _fallbacks import load_config
+
+        try:
+            from core.verification_gates import Gate, GateAction, check_gate, format_gate_message
+            FIC_GATES_AVAILABLE = True
+        except ImportError:
+            from _fallbacks import Gate, GateAction, check_gate, format_gate_message
+            FIC_GATES_AVAILABLE = False
+
+    return SimpleNamespace(
+        json_loads=json_loads, json_dumps=json_dumps,
+        load_config=load_config,
+        Gate=Gate, GateAction=GateAction,
+        check_gate=check_gate, format_gate_message=format_gate_message,
+        FIC_GATES_AVAILABLE=FIC_GATES_AVAILABLE,
+    )
+
+
+def check_fic_gates(harness, tool_name: str, tool_input: dict, work_dir: str, config: dict) -> tuple:
     """
     Check FIC verification gates for Edit/Write operations.
 
+    harness is the namespace returned by import_harness_modules().
+
     Returns: (action, message)
     - action: 'allow', 'warn', 'block'
     - message: Message to display (None if allow)
     """
-    if not FIC_GATES_AVAILABLE:
+    if not harness.FIC_GATES_AVAILABLE:
         return 'allow', None
 
     if not config.get('fic_enabled', True):
         return 'allow', None
 
     # Only check gates for file modifications
-    if tool_name not in ['Edit', 'Write']:
+    if tool_name not in GATED_TOOLS:
         return 'allow', None
 
     file_path = tool_input.get('file_path', '')
 
     # Determine which gate to check
     if tool_name == 'Edit':
-        gate = Gate.ALLOW_EDIT
+        gate = harness.Gate.ALLOW_EDIT
     else:
-        gate = Gate.ALLOW_WRITE
+        gate = harness.Gate.ALLOW_WRITE
 
     # Check the gate
-    result = check_gate(gate, work_dir, file_path=file_path)
+    result = harness.check_gate(gate, work_dir, file_path=file_path)
 
-    if result.action == GateAction.BLOCK:
-        return 'block', format_gate_message(result)
-    elif result.action == GateAction.WARN:
-        return 'warn', format_gate_message(result)
+    if result.action == harness.GateAction.BLOCK:
+        return 'block', harness.format_gate_message(result)
+    elif result.action == harness.GateAction.WARN:
+        return 'warn', harness.format_gate_message(result)
     else:
         return 'allow', None
 
@@ -100,29 +112,35 @@ def check_fic_gates(tool_name: str, tool_input: dict, work_dir: str, config: dic
 def main():
     """Main entry point for PreToolUse hook."""
     try:
-        # Read input from stdin
-        # Handle empty or invalid stdin gracefully
+        # Always drain stdin so the caller never blocks on a full pipe
         try:
             stdin_content = sys.stdin.read()
-            input_data = json.loads(stdin_content) if stdin_content.strip() else {}
-        except (json.JSONDecodeError, ValueError):
+        except ValueError:
+            stdin_content = ''
+        work_dir = os.environ.get('CLAUDE_WORKING_DIRECTORY', os.getcwd())
+
+        # Check if harness is initialized (single stat, before any imports)
+        if not os.path.exists(os.path.join(work_dir, INITIALIZED_MARKER)):
+            print('{}')
+            sys.exit(0)
+
+        harness = import_harness_modules()
+
+        # Handle empty or invalid stdin gracefully
+        try:
+            input_data = harness.json_loads(stdin_content) if stdin_content and not stdin_content.isspace() else {}
+        except ValueError:
             input_data = {}
 
         tool_name = input_data.get('tool_name', '')
         tool_input = input_data.get('tool_input', {})
-        work_dir = os.environ.get('CLAUDE_WORKING_DIRECTORY', os.getcwd())
-
-        # Check if harness is initialized
-        if not is_harness_initialized(work_dir):
-            print(json.dumps({}))
-            sys.exit(0)
 
         # Load config
-        config = load_config(work_dir)
+        config = harness.load_config(work_dir)
 
         # Skip all validation in relaxed mode
-        if is_relaxed_mode(work_dir):
-            print(json.dumps({}))
+        if config.get('strictness') == 'relaxed':
+            print(harness.json_dumps({}))
             sys.exit(0)
 
         result = {}
@@ -131,7 +149,7 @@ def main():
         # ========================================
         # FIC Verification Gates
         # ========================================
-        fic_action, fic_message = check_fic_gates(tool_name, tool_input, work_dir, config)
+        fic_action, fic_message = check_fic_gates(harness, tool_name, tool_input, work_dir, config)
 
         if fic_action == 'block':
             # FIC gate blocks the operation
@@ -141,7 +159,7 @@ def main():
             messages.append(fic_message)
             messages.append("\n[FIC Gate: Operation blocked. Complete prior phase first.]")
             result['systemMessage'] = '\n'.join(messages)
-            print(json.dumps(result))
+            print(harness.json_dumps(result))
             sys.exit(0)
         elif fic_action == 'warn' and fic_message:
             messages.append(fic_message)
@@ -150,12 +168,13 @@ def main():
         if messages:
             result['systemMessage'] = '\n'.join(messages)
 
-        print(json.dumps(result))
+        print(harness.json_dumps(result))
 
     except Exception as e:
-        # Non-blocking error handling
+        # Non-blocking error handling (json may not be imported yet)
+        import json as json_lib
         error_msg = {"systemMessage": f"[Harness] PreToolUse hook error: {str(e)}"}
-        print(json.dumps(error_msg))
+        print(json_lib.dumps(error_msg))
 
     finally:
         sys.exit(0)
@@ -522,7 +522,7 @@ def main():
         # Handle empty or invalid stdin gracefully
         try:
             stdin_content = sys.stdin.read()
-            input_data = json.loads(stdin_content) if stdin_content.strip() else {}
+            input_data = json.loads(stdin_content) if stdin_content and not stdin_content.isspace() else {}
         except (json.JSONDecodeError, ValueError):
             input_data = {}
 
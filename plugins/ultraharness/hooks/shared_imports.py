@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Shared imports and fallbacks for all hooks.
 
-This module centralizes the import logic and fallback definitions
-that are common across all hooks. Using this module:
+This module centralizes the import logic that is common across all hooks.
+Core modules are imported lazily, on first use of one of their names, and
+the fallback definitions in _fallbacks.py are only imported when a core
+module is unavailable. Using this module:
 1. Reduces code duplication (~200 lines saved)
 2. Ensures consistent fallback behavior
 3. Makes maintenance easier
@@ -17,13 +19,24 @@ Usage in hooks:
         InformationClass, FIC_AVAILABLE, CONTEXT_INTELLIGENCE_AVAILABLE,
         ArtifactType, get_latest_artifact, load_artifact,
         Gate, GateAction, check_gate, format_gate_message, FIC_GATES_AVAILABLE,
-        TestResult, run_tests, get_test_summary_string
+        TestResult, run_tests, get_test_summary_string,
+        json_loads, json_dumps
     )
 """
 
+from __future__ import annotations
+
 import os
 import sys
-from pathlib import Path
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
+
+# Annotations are not evaluated at runtime (postponed, PEP 563), so typing
+# is only imported for type checkers, not on every hook start
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
 
 # Add plugin root to path for imports
 PLUGIN_ROOT = os.environ.get('CLAUDE_PLUGIN_ROOT', '')
@@ -32,387 +45,235 @@ if PLUGIN_ROOT:
 
 
 # ============================================
-# Config Module
+# JSON (orjson when installed, stdlib otherwise)
 # ============================================
+# Both parsers raise ValueError subclasses on malformed input
 try:
-    from core.config import (
-        load_config,
-        is_strict_mode,
-        is_relaxed_mode,
-        is_standard_mode,
-        is_harness_initialized,
-        get_setting,
-        set_setting,
-        get_config_path,
-        clear_config_cache
-    )
-    CONFIG_AVAILABLE = True
+    import orjson
+    import json
+
+    def json_loads(data):
+        # orjson rejects the NaN/Infinity tokens stdlib json writes for
+        # non-finite floats; retry those with the stdlib parser
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            return json.loads(data)
+
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
 except ImportError:
-    CONFIG_AVAILABLE = False
-
-    def load_config(work_dir=None):
-        return {
-            "strictness": "standard",
-            "auto_progress_logging": True,
-            "auto_checkpoint_suggestions": True,
-            "fic_enabled": True,
-            "fic_context_tracking": True,
-            "fic_auto_delegate_research": True,
-            "feature_enforcement": True,
-            "init_script_execution": True,
-            "baseline_tests_on_startup": True
-        }
-
-    def is_strict_mode(work_dir=None):
-        return False
-
-    def is_relaxed_mode(work_dir=None):
-        return False
-
-    def is_standard_mode(work_dir=None):
-        return True
+    import json
 
-    def is_harness_initialized(work_dir=None):
-        if work_dir is None:
-            work_dir = os.environ.get('CLAUDE_WORKING_DIRECTORY', os.getcwd())
-        marker_path = Path(work_dir) / '.claude' / '.claude-harness-initialized'
-        return marker_path.exists()
-
-    def get_setting(key, work_dir=None):
-        return None
-
-    def set_setting(key, value, work_dir=None):
-        return False
-
-    def get_config_path(work_dir=None):
-        if work_dir is None:
-            work_dir = os.environ.get('CLAUDE_WORKING_DIRECTORY', os.getcwd())
-        return Path(work_dir) / '.claude' / 'claude-harness.json'
-
-    def clear_config_cache(work_dir=None):
-        pass
+    json_loads = json.loads
+    json_dumps = json.dumps
 
 
 # ============================================
-# Validation Module
+# Core Modules (resolved lazily)
 # ============================================
-try:
-    from core.validation import (
-        validate_path,
-        validate_work_dir,
-        validate_session_id,
-        safe_join,
-        sanitize_filename
+# Public name -> (core module, attribute). Nothing is imported up front:
+# the module-level __getattr__ (PEP 562) imports a core module the first
+# time one of its names is used and caches the name in the module globals,
+# so later lookups never reach __getattr__ again. If the core module is
+# unavailable, the name resolves to its stub in _fallbacks.py instead.
+_LAZY = {
+    name: (module, name)
+    for module, names in (
+        ("core.config", (
+            "load_config", "is_strict_mode", "is_relaxed_mode", "is_standard_mode",
+            "is_harness_initialized", "get_setting", "set_setting",
+            "get_config_path", "clear_config_cache",
+        )),
+        ("core.validation", (
+            "validate_path", "validate_work_dir", "validate_session_id",
+            "safe_join", "sanitize_filename",
+        )),
+        ("core.change_detector", (
+            "classify_change", "should_auto_log", "should_suggest_checkpoint", "ChangeLevel",
+        )),
+        ("core.progress", (
+            "append_progress", "read_progress", "log_session_start", "log_session_end",
+            "log_checkpoint", "initialize_progress_file",
+        )),
+        ("core.features", (
+            "load_features", "get_next_features", "save_features", "get_feature_by_id",
+        )),
+        ("core.context_intelligence", (
+            "load_context_state", "save_context_state", "add_context_entry",
+            "get_context_summary", "extract_essential_context", "InformationClass",
+            "estimate_tokens",
+        )),
+        ("core.artifacts", (
+            "ArtifactType", "get_latest_artifact", "load_artifact", "save_artifact",
+        )),
+        ("core.verification_gates", (
+            "Gate", "GateAction", "check_gate", "format_gate_message",
+        )),
+        ("core.test_runner", (
+            "run_tests", "get_test_summary_string", "TestResult", "detect_project_type",
+        )),
+        ("core.browser_automation", (
+            "take_screenshot", "verify_element", "detect_browser_tool", "BrowserResult",
+        )),
     )
-    VALIDATION_AVAILABLE = True
-except ImportError:
-    VALIDATION_AVAILABLE = False
-
-    def validate_path(path, work_dir=None, must_exist=False, allow_absolute=True):
-        if path and isinstance(path, str):
-            return True, None, Path(path)
-        return False, "Invalid path", None
-
-    def validate_work_dir(work_dir):
-        if work_dir and os.path.isdir(work_dir):
-            return True, None
-        return False, "Invalid directory"
-
-    def validate_session_id(session_id):
-        if session_id and len(session_id) <= 128 and '..' not in session_id:
-            return True, None
-        return False, "Invalid session ID"
-
-    def safe_join(base, *paths):
-        return Path(base).joinpath(*paths)
-
-    def sanitize_filename(filename, max_length=255):
-        return filename[:max_length] if filename else "unnamed"
-
-
-# ============================================
-# Change Detector Module
-# ============================================
-try:
-    from core.change_detector import (
-        classify_change,
-        should_auto_log,
-        should_suggest_checkpoint,
-        ChangeLevel
-    )
-    CHANGE_DETECTOR_AVAILABLE = True
-except ImportError:
-    CHANGE_DETECTOR_AVAILABLE = False
-
-    class ChangeLevel:
-        TRIVIAL = "trivial"
-        SIGNIFICANT = "significant"
-        MAJOR = "major"
-
-    def classify_change(tool_name, tool_input, tool_result=None):
-        return (ChangeLevel.TRIVIAL, "fallback")
-
-    def should_auto_log(level):
-        return False
-
-    def should_suggest_checkpoint(level):
-        return False
-
-
-# ============================================
-# Progress Module
-# ============================================
-try:
-    from core.progress import (
-        append_progress,
-        read_progress,
-        log_session_start,
-        log_session_end,
-        log_checkpoint,
-        initialize_progress_file
-    )
-    PROGRESS_AVAILABLE = True
-except ImportError:
-    PROGRESS_AVAILABLE = False
-
-    def append_progress(msg, work_dir=None, include_timestamp=True):
-        pass
-
-    def read_progress(work_dir=None):
-        return ""
-
-    def log_session_start(work_dir=None):
-        pass
-
-    def log_session_end(work_dir=None):
-        pass
-
-    def log_checkpoint(commit_hash, message, work_dir=None):
-        pass
-
-    def initialize_progress_file(project_name=None, work_dir=None):
-        return False
-
-
-# ============================================
-# Features Module
-# ============================================
-try:
-    from core.features import (
-        load_features,
-        get_next_features,
-        save_features,
-        get_feature_by_id
-    )
-    FEATURES_AVAILABLE = True
-except ImportError:
-    FEATURES_AVAILABLE = False
-
-    def load_features(work_dir=None):
-        return {"features": []}
-
-    def get_next_features(count=5, work_dir=None):
-        return []
-
-    def save_features(features_data, work_dir=None):
-        return False
-
-    def get_feature_by_id(feature_id, work_dir=None):
-        return None
-
-
-# ============================================
-# Context Intelligence Module
-# ============================================
-try:
-    from core.context_intelligence import (
-        load_context_state,
-        save_context_state,
-        add_context_entry,
-        get_context_summary,
-        extract_essential_context,
-        InformationClass,
-        estimate_tokens
-    )
-    CONTEXT_INTELLIGENCE_AVAILABLE = True
-    FIC_AVAILABLE = True
-except ImportError:
-    CONTEXT_INTELLIGENCE_AVAILABLE = False
-    FIC_AVAILABLE = False
-
-    class InformationClass:
-        ESSENTIAL = "essential"
-        HELPFUL = "helpful"
-        NOISE = "noise"
-
-    def load_context_state(session_id, work_dir=None):
-        return None
-
-    def save_context_state(state, work_dir=None):
+    for name in names
+}
+
+# Availability flag -> core module it reports on
+_FLAG_TO_MOD = {
+    "CONFIG_AVAILABLE": "core.config",
+    "VALIDATION_AVAILABLE": "core.validation",
+    "CHANGE_DETECTOR_AVAILABLE": "core.change_detector",
+    "PROGRESS_AVAILABLE": "core.progress",
+    "FEATURES_AVAILABLE": "core.features",
+    "CONTEXT_INTELLIGENCE_AVAILABLE": "core.context_intelligence",
+    "ARTIFACTS_AVAILABLE": "core.artifacts",
+    "FIC_GATES_AVAILABLE": "core.verification_gates",
+    "TEST_RUNNER_AVAILABLE": "core.test_runner",
+    "BROWSER_AVAILABLE": "core.browser_automation",
+}
+
+# Opt-in core modules -> env var that enables them. Until enabled, the
+# module is reported unavailable without probing for it, its flag is
+# False and its names resolve to the stubs in _fallbacks.py.
+_OPT_IN_MODULES = {
+    "core.browser_automation": "CLAUDE_ENABLE_BROWSER",
+}
+
+# Flags that are other names for an existing flag (FIC is built on
+# context_intelligence), so both share one resolved value
+_FLAG_ALIASES = {
+    "FIC_AVAILABLE": "CONTEXT_INTELLIGENCE_AVAILABLE",
+}
+
+
+def _env_flag(name):
+    """Check whether an opt-in environment variable is switched on."""
+    return os.environ.get(name, '').lower() in ('1', 'true', 'yes')
+
+
+@lru_cache(maxsize=None)
+def _find(module_name):
+    """Find a core module's spec once, without executing its body.
+
+    find_spec only consults the import finders (directory listings), so
+    probing a flag does not import the module and its dependencies.
+
+    A module that is not found is recorded as None in sys.modules, so any
+    later `import core.x` in the process fails immediately with
+    ModuleNotFoundError instead of searching sys.path again.
+    """
+    try:
+        spec = find_spec(module_name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        sys.modules.setdefault(module_name, None)
+    return spec
+
+
+def _available(module_name):
+    """Check whether a core module exists (and is enabled, if opt-in)."""
+    env_var = _OPT_IN_MODULES.get(module_name)
+    if env_var and not _env_flag(env_var):
         return False
+    return _find(module_name) is not None
 
-    def add_context_entry(state, tool_name, tool_input, tool_result):
-        return state, None
-
-    def get_context_summary(state):
-        return ""
-
-    def extract_essential_context(state):
-        return {}
-
-    def estimate_tokens(content, content_type=None):
-        return int(len(content) * 0.25)
 
+def _make_resolver(module_name, attr):
+    """Build the zero-argument resolver for one lazily imported name."""
+    def resolve():
+        try:
+            # A module the finders already reported missing goes straight
+            # to its stub instead of repeating the failed import
+            if not _available(module_name):
+                raise ImportError(module_name)
+            return getattr(import_module(module_name), attr)
+        except (ImportError, AttributeError):
+            import _fallbacks
+            return getattr(_fallbacks, attr)
+    return resolve
 
-# ============================================
-# Artifacts Module
-# ============================================
-try:
-    from core.artifacts import (
-        ArtifactType,
-        get_latest_artifact,
-        load_artifact,
-        save_artifact
-    )
-    ARTIFACTS_AVAILABLE = True
-except ImportError:
-    ARTIFACTS_AVAILABLE = False
-
-    class ArtifactType:
-        RESEARCH = "research"
-        PLAN = "plan"
-        IMPLEMENTATION = "implementation"
 
-    def get_latest_artifact(artifact_type, work_dir=None):
-        return None
+def _make_flag(module_name):
+    """Build the resolver for one availability flag."""
+    return lambda: _available(module_name)
 
-    def load_artifact(artifact_type, artifact_id, work_dir=None):
-        return None
 
-    def save_artifact(artifact, work_dir=None):
-        return False
+def _make_alias(target):
+    """Build the resolver for a flag alias: resolve (and cache) its target."""
+    return lambda: getattr(sys.modules[__name__], target)
 
 
-# ============================================
-# Verification Gates Module
-# ============================================
-try:
-    from core.verification_gates import (
-        Gate,
-        GateAction,
-        check_gate,
-        format_gate_message
-    )
-    FIC_GATES_AVAILABLE = True
-except ImportError:
-    FIC_GATES_AVAILABLE = False
+# Every lazily resolved name -> its resolver, built once at import time so
+# __getattr__ is a single dict lookup plus a call
+_RESOLVE = {name: _make_resolver(module, attr) for name, (module, attr) in _LAZY.items()}
+_RESOLVE.update((flag, _make_flag(module)) for flag, module in _FLAG_TO_MOD.items())
+_RESOLVE.update((alias, _make_alias(target)) for alias, target in _FLAG_ALIASES.items())
 
-    class Gate:
-        ALLOW_EDIT = "allow_edit"
-        ALLOW_WRITE = "allow_write"
-        ALLOW_BASH = "allow_bash"
-        RESEARCH_COMPLETE = "research_complete"
-        PLAN_VALIDATED = "plan_validated"
 
-    class GateAction:
-        ALLOW = "allow"
-        WARN = "warn"
-        BLOCK = "block"
+def __getattr__(name):
+    """Resolve core module names and availability flags on first access."""
+    try:
+        resolve = _RESOLVE[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-    def check_gate(gate, work_dir=None, **kwargs):
-        class Result:
-            action = GateAction.ALLOW
-            reason = ""
-            suggestions = []
-        return Result()
+    value = resolve()
+    globals()[name] = value
+    return value
 
-    def format_gate_message(result):
-        return ""
 
+def __dir__():
+    """List lazily resolved names alongside the module globals."""
+    return sorted(set(globals()) | set(_RESOLVE))
 
-# ============================================
-# Test Runner Module
-# ============================================
-try:
-    from core.test_runner import (
-        run_tests,
-        get_test_summary_string,
-        TestResult,
-        detect_project_type
-    )
-    TEST_RUNNER_AVAILABLE = True
-except ImportError:
-    TEST_RUNNER_AVAILABLE = False
 
-    class TestResult:
-        NOT_RUN = "not_run"
-        PASSED = "passed"
-        FAILED = "failed"
-        SKIPPED = "skipped"
-        ERROR = "error"
+def _import_core_modules():
+    """Import every available core module up front.
 
-    def run_tests(work_dir, timeout=120, config=None):
-        class Summary:
-            result = TestResult.NOT_RUN
-            raw_output = "Test runner not available"
-            total = 0
-            passed = 0
-            failed = 0
-            skipped = 0
-            errors = 0
-        return Summary()
+    Only used when CLAUDE_EAGER_IMPORT is set, for callers that will touch
+    most core modules anyway; by default everything stays lazy. Imports run
+    one after another: module bodies are CPU-bound and serialize on the
+    import lock, so a thread pool measured slower than this loop.
+    """
+    for module_name in dict.fromkeys(m for m, _ in _LAZY.values()):
+        if module_name in sys.modules or not _available(module_name):
+            continue
+        try:
+            import_module(module_name)
+        except ImportError:
+            pass  # Resolved to its stub on first use instead
 
-    def get_test_summary_string(summary):
-        return "Tests not run"
 
-    def detect_project_type(work_dir):
-        return None
+if _env_flag('CLAUDE_EAGER_IMPORT'):
+    _import_core_modules()
 
 
 # ============================================
-# Browser Automation Module
+# Utility Functions
 # ============================================
-try:
-    from core.browser_automation import (
-        take_screenshot,
-        verify_element,
-        detect_browser_tool,
-        BrowserResult
-    )
-    BROWSER_AVAILABLE = True
-except ImportError:
-    BROWSER_AVAILABLE = False
-
-    class BrowserResult:
-        def __init__(self, success=False, error=None):
-            self.success = success
-            self.error = error
-
-    def take_screenshot(*args, **kwargs):
-        return BrowserResult(success=False, error="Browser automation not available")
-
-    def verify_element(*args, **kwargs):
-        return BrowserResult(success=False, error="Browser automation not available")
-
-    def detect_browser_tool(work_dir):
-        return None
+@lru_cache(maxsize=1)
+def _cached_cwd() -> str:
+    """Get the process working directory, looked up once (hooks never chdir)."""
+    return os.getcwd()
 
 
-# ============================================
-# Utility Functions
-# ============================================
-def get_working_directory():
+def get_working_directory() -> str:
     """Get the current working directory from environment or fallback to cwd."""
-    return os.environ.get('CLAUDE_WORKING_DIRECTORY', os.getcwd())
+    # The env var is read on every call so changes to it take effect
+    # immediately; only the getcwd() fallback is memoized
+    work_dir = os.environ.get('CLAUDE_WORKING_DIRECTORY')
+    return work_dir if work_dir is not None else _cached_cwd()
 
 
-def safe_json_loads(content):
+def safe_json_loads(content: str) -> Any:
     """Safely parse JSON, returning empty dict on failure."""
+    if not content:
+        return {}
+    # Whitespace-only input is rejected by the parser itself; no strip() copy
     try:
-        return json.loads(content) if content and content.strip() else {}
-    except (json.JSONDecodeError, ValueError, TypeError):
+        return json_loads(content)
+    except (ValueError, TypeError):
         return {}
-
-
-# Need to import json for safe_json_loads
-import json